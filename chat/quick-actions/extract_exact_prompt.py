@@ -65,16 +65,12 @@ def extract_exact_prompt():
 const DSPY_SYSTEM_PROMPT = `Your input fields are:
 1. \`heading\` (str): The full section heading text
 Your output fields are:
-1. \`reasoning\` (str): 
-2. \`label\` (str): A short 1-3 word label suitable for a navigation button
+1. \`label\` (str): A short 1-3 word label suitable for a navigation button
 All interactions will be structured in the following way, with the appropriate values filled in.
 
 [[ ## heading ## ]]
 {heading}
 
-[[ ## reasoning ## ]]
-{reasoning}
-
 [[ ## label ## ]]
 {label}
 
@@ -94,10 +90,7 @@ const DSPY_EXAMPLES = [
 
 [[ ## heading ## ]]
 {ex['heading']}`,
-        assistant: `[[ ## reasoning ## ]]
-Not supplied for this particular example. 
-
-[[ ## label ## ]]
+        assistant: `[[ ## label ## ]]
 {ex['label']}`
     }}"""
                 if i < len(examples) - 1:
@@ -131,7 +124,7 @@ export async function generateQuickActionLabelDSPy(heading, llmClient) {
         content: `[[ ## heading ## ]]
 ${heading}
 
-Respond with the corresponding output fields, starting with the field \`[[ ## reasoning ## ]]\`, then \`[[ ## label ## ]]\`, and then ending with the marker for \`[[ ## completed ## ]]\`.`
+Respond with the corresponding output fields, starting with the field \`[[ ## label ## ]]\`, and then ending with the marker for \`[[ ## completed ## ]]\`.`
     });
     
     try {
@@ -1,34 +1,37 @@
 #!/usr/bin/env python3
 """Extract training data from report.md headings."""
 
+import mmap
 import re
 import json
 from pathlib import Path
 
+# Headings with optional parenthetical labels, matched directly on the file bytes.
+# Whitespace classes exclude newlines so a match never spans more than one line.
+HEADING_PATTERN = re.compile(
+    rb'^(#{1,2})[^\S\n]+(.+?)(?:[^\S\n]*\(([^)\n]+)\))?[^\S\n]*$',
+    re.MULTILINE,
+)
+
 def extract_headings_with_labels(markdown_path):
     """Extract H1 and H2 headings with their parenthetical labels."""
-    with open(markdown_path, 'r') as f:
-        content = f.read()
-    
-    # Pattern to match headings with optional parenthetical labels
-    pattern = r'^(#{1,2})\s+(.+?)(?:\s*\(([^)]+)\))?\s*$'
-    
     training_data = []
     
-    for line in content.split('\n'):
-        match = re.match(pattern, line)
-        if match:
-            level = len(match.group(1))  # 1 for H1, 2 for H2
-            full_text = match.group(2).strip()
-            label = match.group(3) if match.group(3) else None
-            
-            if label:  # Only include headings that have labels
-                training_data.append({
-                    'level': level,
-                    'full_heading': full_text,
-                    'short_label': label,
-                    'original_line': line.strip()
-                })
+    with open(markdown_path, 'rb') as f:
+        # mmap rejects empty files
+        if f.seek(0, 2) == 0:
+            return training_data
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in HEADING_PATTERN.finditer(content):
+                label = match.group(3)
+                
+                if label:  # Only include headings that have labels
+                    training_data.append({
+                        'level': len(match.group(1)),  # 1 for H1, 2 for H2
+                        'full_heading': match.group(2).decode('utf-8').strip(),
+                        'short_label': label.decode('utf-8'),
+                        'original_line': match.group(0).decode('utf-8').strip()
+                    })
     
     return training_data
 
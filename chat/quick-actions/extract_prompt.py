@@ -36,24 +36,29 @@ def create_javascript_function():
     test_heading = "Sample Section Heading"
     _ = model(heading=test_heading)
     
+    # Lowercase heading -> label, keeping the first label for duplicate headings
+    example_map = {}
+    for ex in examples:
+        example_map.setdefault(ex['heading'].lower(), ex['label'])
+    
     # Create JavaScript function
     js_code = """/**
+ * Examples learned from the training data, keyed by lowercased heading.
+ * Built once at module load so direct matches are a single Map lookup.
+ */
+const EXAMPLE_MAP = new Map(""" + json.dumps(list(example_map.items()), indent=4) + """);
+
+/**
  * Generate a short label for a section heading using the pattern learned from DSPy.
  * This replaces the manual metadata hack of using parentheses in headings.
  */
 export function generateQuickActionLabel(heading) {
-    // Examples learned from the training data
-    const examples = """ + json.dumps(examples, indent=4) + """;
-    
     // Simple pattern matching based on examples
     const headingLower = heading.toLowerCase();
     
     // Check for direct matches
-    for (const example of examples) {
-        if (example.heading.toLowerCase() === headingLower) {
-            return example.label;
-        }
-    }
+    const directMatch = EXAMPLE_MAP.get(headingLower);
+    if (directMatch) return directMatch;
     
     // Apply learned patterns
     if (headingLower.includes('introduction')) return 'Introduction';
@@ -1,61 +1,61 @@
+/**
+ * Examples learned from the training data, keyed by lowercased heading.
+ * Built once at module load so direct matches are a single Map lookup.
+ */
+const EXAMPLE_MAP = new Map([
+    [
+        "tech writer agent in 7 different frameworks",
+        "Overview"
+    ],
+    [
+        "but first, how many agent maker frameworks are there?",
+        "Agent Landscape"
+    ],
+    [
+        "why did you pick the tech writer agent for evaluation?",
+        "Tech Writer Choice"
+    ],
+    [
+        "what did i learn?",
+        "Insights"
+    ],
+    [
+        "what did i standardise on?",
+        "Shared Code"
+    ],
+    [
+        "how did i rank them?",
+        "Leaderboard"
+    ],
+    [
+        "google agent developer kit",
+        "adk-python"
+    ],
+    [
+        "other python agent maker frameworks",
+        "Other Packages"
+    ],
+    [
+        "other python agent makers",
+        "Python Servers"
+    ],
+    [
+        "typescript agent makers",
+        "TypeScript Agents"
+    ]
+]);
+
 /**
  * Generate a short label for a section heading using the pattern learned from DSPy.
  * This replaces the manual metadata hack of using parentheses in headings.
  */
 export function generateQuickActionLabel(heading) {
-    // Examples learned from the training data
-    const examples = [
-    {
-        "heading": "Tech Writer Agent in 7 different frameworks",
-        "label": "Overview"
-    },
-    {
-        "heading": "But first, how many agent maker frameworks are there?",
-        "label": "Agent Landscape"
-    },
-    {
-        "heading": "Why did you pick the tech writer agent for evaluation?",
-        "label": "Tech Writer Choice"
-    },
-    {
-        "heading": "What did I learn?",
-        "label": "Insights"
-    },
-    {
-        "heading": "What did I standardise on?",
-        "label": "Shared Code"
-    },
-    {
-        "heading": "How did I rank them?",
-        "label": "Leaderboard"
-    },
-    {
-        "heading": "Google Agent Developer Kit",
-        "label": "adk-python"
-    },
-    {
-        "heading": "Other python agent maker frameworks",
-        "label": "Other Packages"
-    },
-    {
-        "heading": "Other python agent makers",
-        "label": "Python Servers"
-    },
-    {
-        "heading": "TypeScript agent makers",
-        "label": "TypeScript Agents"
-    }
-];
-    
     // Simple pattern matching based on examples
     const headingLower = heading.toLowerCase();
     
     // Check for direct matches
-    for (const example of examples) {
-        if (example.heading.toLowerCase() === headingLower) {
-            return example.label;
-        }
-    }
+    const directMatch = EXAMPLE_MAP.get(headingLower);
+    if (directMatch) return directMatch;
     
     // Apply learned patterns
     if (headingLower.includes('introduction')) return 'Introduction';
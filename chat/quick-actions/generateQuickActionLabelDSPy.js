@@ -7,16 +7,12 @@
 const DSPY_SYSTEM_PROMPT = `Your input fields are:
 1. \`heading\` (str): The full section heading text
 Your output fields are:
-1. \`reasoning\` (str): 
-2. \`label\` (str): A short 1-3 word label suitable for a navigation button
+1. \`label\` (str): A short 1-3 word label suitable for a navigation button
 All interactions will be structured in the following way, with the appropriate values filled in.
 
 [[ ## heading ## ]]
 {heading}
 
-[[ ## reasoning ## ]]
-{reasoning}
-
 [[ ## label ## ]]
 {label}
 
@@ -31,10 +27,7 @@ const DSPY_EXAMPLES = [
 
 [[ ## heading ## ]]
 Other python agent maker frameworks`,
-        assistant: `[[ ## reasoning ## ]]
-Not supplied for this particular example. 
-
-[[ ## label ## ]]
+        assistant: `[[ ## label ## ]]
 Other Packages`
     },
     {
@@ -42,10 +35,7 @@ Other Packages`
 
 [[ ## heading ## ]]
 Google Agent Developer Kit`,
-        assistant: `[[ ## reasoning ## ]]
-Not supplied for this particular example. 
-
-[[ ## label ## ]]
+        assistant: `[[ ## label ## ]]
 adk-python`
     },
     {
@@ -53,10 +43,7 @@ adk-python`
 
 [[ ## heading ## ]]
 Why did you pick the tech writer agent for evaluation?`,
-        assistant: `[[ ## reasoning ## ]]
-Not supplied for this particular example. 
-
-[[ ## label ## ]]
+        assistant: `[[ ## label ## ]]
 Tech Writer Choice`
     },
     {
@@ -64,10 +51,7 @@ Tech Writer Choice`
 
 [[ ## heading ## ]]
 What did I standardise on?`,
-        assistant: `[[ ## reasoning ## ]]
-Not supplied for this particular example. 
-
-[[ ## label ## ]]
+        assistant: `[[ ## label ## ]]
 Shared Code`
     }
 ];
@@ -96,7 +80,7 @@ export async function generateQuickActionLabelDSPy(heading, llmClient) {
         content: `[[ ## heading ## ]]
 ${heading}
 
-Respond with the corresponding output fields, starting with the field \`[[ ## reasoning ## ]]\`, then \`[[ ## label ## ]]\`, and then ending with the marker for \`[[ ## completed ## ]]\`.`
+Respond with the corresponding output fields, starting with the field \`[[ ## label ## ]]\`, and then ending with the marker for \`[[ ## completed ## ]]\`.`
     });
     
     try {
@@ -22,7 +22,8 @@ class GenerateLabel(dspy.Signature):
 class LabelGenerator(dspy.Module):
     def __init__(self):
         super().__init__()
-        self.generate = dspy.ChainOfThought(GenerateLabel)
+        # Plain Predict: labels are extractive, so a reasoning field only adds output tokens
+        self.generate = dspy.Predict(GenerateLabel)
     
     def forward(self, heading):
         return self.generate(heading=heading)
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import subprocess
-import os
 
 repo_path = "/Users/julian/.cache/github/axios/axios"
 
@@ -39,14 +38,22 @@ else:
 
 # Check what patterns might be missing files
 print("\nAnalyzing missing files...")
+
+# Classify hidden and extensionless files in one pass over the basenames
+hidden_files, no_ext = [], []
+for f in git_files:
+    base = f.rpartition('/')[2]
+    if f.startswith('.') or base.startswith('.'):
+        hidden_files.append(f)
+    if '.' not in base:
+        no_ext.append(f)
+
 print("\nChecking hidden files in git:")
-hidden_files = [f for f in git_files if f.startswith('.') or '/' in f and f.split('/')[-1].startswith('.')]
 print(f"Hidden files in git: {len(hidden_files)}")
 for f in sorted(hidden_files)[:10]:
     print(f"  {f}")
 
 print("\nChecking files without extensions:")
-no_ext = [f for f in git_files if '.' not in os.path.basename(f)]
 print(f"Files without extensions: {len(no_ext)}")
 for f in sorted(no_ext)[:10]:
     print(f"  {f}")
\ No newline at end of file
@@ -10,13 +10,22 @@ def configure_logging():
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / f"tech-writer-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.log"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    # Records never use thread/process names, so skip looking them up for each one
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    root = logging.getLogger()
+    # Like basicConfig, leave an already-configured root logger alone
+    if not root.handlers:
+        # Only the file log gets timestamps; the console skips the per-record strftime
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+
+        root.addHandler(file_handler)
+        root.addHandler(stream_handler)
+        root.setLevel(logging.INFO)
     logger = logging.getLogger(__name__)
     logger.info(f"Logging to file: {log_file}")
@@ -1,9 +1,106 @@
-from typing import List, Dict, Any, Union
+import fnmatch
+import logging
+import os
+import re
+from typing import Iterator, List, Dict, Any, Tuple, Union
 from pathlib import Path
 from .logging import logger
-from binaryornot.check import is_binary
 from .utils import get_gitignore_spec
 
+# Bytes sniffed for a NUL byte to detect binary files (the same heuristic git uses)
+BINARY_SNIFF_BYTES = 8192
+
+def _match_path_segments(segments, parts, i=0, j=0) -> bool:
+    """
+    Match path parts against compiled pattern segments, where None stands for '**'
+    (zero or more directories, never the file name itself, as in rglob).
+    """
+    while i < len(segments):
+        if segments[i] is None:
+            return any(_match_path_segments(segments, parts, i + 1, k) for k in range(j, len(parts)))
+        if j == len(parts) or not segments[i](parts[j]):
+            return False
+        i += 1
+        j += 1
+    return j == len(parts)
+
+def _normalise_pattern(pattern: str) -> str:
+    """
+    Normalise a glob pattern the way pathlib does before matching: '.' and empty
+    segments are dropped, so './*.py' and 'src//*.py' mean '*.py' and 'src/*.py'.
+    A trailing '/' selects directories only, so it normalises to '' (no files).
+    """
+    if pattern.endswith('/'):
+        return ''
+    return '/'.join(segment for segment in pattern.split('/') if segment not in ('', '.'))
+
+def _walk_matching_files(
+    directory_path: Path,
+    pattern: str,
+    spec,
+    recursive: bool = True
+    ) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (path, posix relative path) for files matching pattern, like rglob (or glob
+    when recursive is False, for patterns without a '/').
+    
+    Works on plain strings from os.scandir; callers only build Path objects for survivors.
+    Gitignored directories (including .git/) are pruned before descending, so their
+    contents are never listed. Expects a pattern from _normalise_pattern.
+    """
+    # rglob(pattern) is glob('**/' + pattern), so leading '**/' segments add nothing
+    while pattern.startswith('**/'):
+        pattern = pattern[3:]
+    
+    # As with rglob, an empty pattern or a bare '**' selects directories only
+    if not pattern or pattern == '**':
+        return
+    
+    # Name-only patterns (the common '*' / '*.py' case) are compiled once and matched
+    # against entry names; anything with a '/' is matched segment by segment on the
+    # relative path, behind an implicit leading '**' so it can start at any depth
+    if '/' not in pattern:
+        name_match = re.compile(fnmatch.translate(pattern)).match
+    else:
+        name_match = None
+        segments = [None] + [
+            None if segment == '**' else re.compile(fnmatch.translate(segment)).match
+            for segment in pattern.split('/')
+        ]
+    
+    stack = [(str(directory_path), '')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", dir_path, e)
+            continue
+        
+        for entry in entries:
+            rel_path = rel_dir + entry.name
+            try:
+                # Like rglob, don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    if not recursive:
+                        continue
+                    if spec and spec.match_file(rel_path + '/'):
+                        continue
+                    stack.append((entry.path, rel_path + '/'))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            
+            if name_match:
+                matched = name_match(entry.name)
+            else:
+                matched = _match_path_segments(segments, rel_path.split('/'))
+            if matched:
+                yield entry.path, rel_path
+
 # Tool functions
 def find_all_matching_files(
     directory: str, 
@@ -31,7 +128,7 @@ def find_all_matching_files(
     
     try:
         directory_path = Path(directory).resolve()
-        logger.debug(f"Resolved directory path: {directory_path}")
+        logger.debug("Resolved directory path: %s", directory_path)
         
         if not directory_path.exists():
             logger.warning(f"Directory not found: {directory}")
@@ -40,52 +137,69 @@ def find_all_matching_files(
         # Get gitignore spec if needed
         spec = get_gitignore_spec(str(directory_path)) if respect_gitignore else None
         if spec:
-            logger.debug(f"Loaded .gitignore patterns from {directory_path}")
+            logger.debug("Loaded .gitignore patterns from %s", directory_path)
         else:
             logger.debug("No .gitignore patterns loaded (respect_gitignore=False or no .gitignore file)")
         
         result = []
+        # Callers wanting strings (e.g. the JSON wrapper) get the walker's strings as-is,
+        # so no Path objects are built for them
+        as_str = return_paths_as == "str"
+        # '..' steps outside the walked tree, so those patterns are left to pathlib as given
+        up_level = '..' in pattern.split('/')
+        if not up_level:
+            pattern = _normalise_pattern(pattern)
         
         # Choose between recursive and non-recursive search
-        if include_subdirs:
-            logger.debug(f"Using recursive search (rglob) with pattern: {pattern}")
-            paths = directory_path.rglob(pattern)
+        if up_level:
+            logger.debug("Using pathlib search for pattern with '..': %s", pattern)
+            glob = directory_path.rglob if include_subdirs else directory_path.glob
+            candidates = (
+                (str(path), path.relative_to(directory_path).as_posix())
+                for path in glob(pattern)
+                if path.is_file()
+            )
+        elif include_subdirs:
+            logger.debug("Using recursive search (pruned scandir walk) with pattern: %s", pattern)
+            candidates = _walk_matching_files(directory_path, pattern, spec)
+        elif '/' not in pattern:
+            logger.debug("Using non-recursive search (scandir) with pattern: %s", pattern)
+            candidates = _walk_matching_files(directory_path, pattern, spec, recursive=False)
         else:
-            logger.debug(f"Using non-recursive search (glob) with pattern: {pattern}")
-            paths = directory_path.glob(pattern)
+            logger.debug("Using non-recursive search (glob) with pattern: %s", pattern)
+            candidates = (
+                (str(path), path.relative_to(directory_path).as_posix())
+                for path in directory_path.glob(pattern)
+                if path.is_file()
+            )
             
-        for path in paths:
-            if path.is_file():
-                # Skip hidden files if not explicitly included
-                # But only skip if they're in hidden directories
-                if not include_hidden and path.name.startswith('.'):
-                    # Check if any parent directory is hidden (excluding the file itself)
-                    rel_path = path.relative_to(directory_path)
-                    parent_parts = rel_path.parts[:-1]  # Exclude the filename
-                    has_hidden_parent = any(part.startswith('.') for part in parent_parts)
-                    
-                    # Only skip if it's in a hidden directory, not just a hidden file in root
-                    if has_hidden_parent:
-                        logger.debug(f"Skipping hidden file in hidden directory: {path}")
-                        continue
-                    # Hidden files in non-hidden directories (like .gitignore) should be included
+        for path_str, rel_path_posix in candidates:
+            # Skip hidden files if not explicitly included
+            # But only skip if they're in hidden directories
+            if not include_hidden and rel_path_posix.rpartition('/')[2].startswith('.'):
+                # Check if any parent directory is hidden (excluding the file itself)
+                parent_parts = rel_path_posix.split('/')[:-1]
+                has_hidden_parent = any(part.startswith('.') for part in parent_parts)
                 
-                # Skip if should be ignored
-                if respect_gitignore and spec:
-                    # Use pathlib to get relative path and convert to posix format
-                    rel_path = path.relative_to(directory_path)
-                    rel_path_posix = rel_path.as_posix()
-                    if spec.match_file(rel_path_posix):
-                        logger.debug(f"Skipping gitignored file: {rel_path_posix}")
-                        continue
-                result.append(path)
+                # Only skip if it's in a hidden directory, not just a hidden file in root
+                if has_hidden_parent:
+                    logger.debug("Skipping hidden file in hidden directory: %s", path_str)
+                    continue
+                # Hidden files in non-hidden directories (like .gitignore) should be included
+            
+            # Skip if should be ignored
+            if respect_gitignore and spec:
+                if spec.match_file(rel_path_posix):
+                    logger.debug("Skipping gitignored file: %s", rel_path_posix)
+                    continue
+            result.append(path_str if as_str else Path(path_str))
         
         logger.info(f"Found {len(result)} matching files")
-        logger.debug(f"Matching files: {[str(p) for p in result[:10]]}{'...' if len(result) > 10 else ''}")
+        # Debug logging uses %-style args so nothing is formatted when DEBUG is off;
+        # the sample list below is only built when a handler will actually emit it
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Matching files: %s%s", [str(p) for p in result[:10]], '...' if len(result) > 10 else '')
         
-        # Return as strings if requested
-        if return_paths_as == "str":
-            return [str(p) for p in result]
         return result
     except (FileNotFoundError, PermissionError) as e:
         logger.error(f"Error accessing files: {e}")
@@ -126,16 +240,24 @@ def read_file(file_path: str) -> Dict[str, Any]:
         if not path.exists():
             return {"error": f"File not found: {file_path}"}
         
-        if is_binary(file_path):
-            logger.debug(f"File detected as binary: {file_path}")
-            return {"error": f"Cannot read binary file: {file_path}"}
+        # Sniff the head first so binaries are rejected without reading them whole;
+        # the decode and line count then work on the one bytes object
+        with open(path, 'rb') as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+            if b'\x00' in head:
+                logger.debug("File detected as binary: %s", file_path)
+                return {"error": f"Cannot read binary file: {file_path}"}
+            data = head + f.read()
+        content = data.decode('utf-8')
         
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Match text-mode reads, which translate \r\n and \r to \n
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         
-        file_size = len(content)
-        logger.info(f"Successfully read file: {file_path} ({file_size} chars)")
-        logger.debug(f"File has {content.count(chr(10))} lines")
+        file_size = len(data)
+        logger.info(f"Successfully read file: {file_path} ({file_size} bytes)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("File has %d lines", data.count(b'\n'))
         
         return {
             "file": file_path,
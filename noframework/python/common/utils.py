@@ -1,5 +1,6 @@
 
 import datetime
+import functools
 from pathlib import Path
 import pathspec
 from pathspec.patterns import GitWildMatchPattern
@@ -10,7 +11,6 @@ import subprocess
 import argparse
 import os
 from typing import List
-from openai import OpenAI
 from .logging import logger
 
 
@@ -131,12 +131,24 @@ def get_gitignore_spec(directory: str) -> pathspec.PathSpec:
     """
     Get a PathSpec object from .gitignore in the specified directory.
     
+    The compiled spec is cached per directory and .gitignore modification time,
+    so repeated tool calls on an unchanged tree don't re-parse the patterns.
+    
     Args:
         directory: The directory containing .gitignore
         
     Returns:
         A PathSpec object for matching against .gitignore patterns
     """
+    try:
+        gitignore_mtime_ns = (Path(directory) / ".gitignore").stat().st_mtime_ns
+    except OSError:
+        gitignore_mtime_ns = 0
+    return _compile_gitignore_spec(str(directory), gitignore_mtime_ns)
+
+@functools.lru_cache(maxsize=64)
+def _compile_gitignore_spec(directory: str, gitignore_mtime_ns: int) -> pathspec.PathSpec:
+    """Build the PathSpec for get_gitignore_spec; gitignore_mtime_ns only keys the cache."""
     # Always ignore .git directory
     ignore_patterns = ['.git/']
     
@@ -435,6 +447,9 @@ def create_metadata(output_file: Path, model_name: str, repo_url: str, repo_name
         # Run evaluation if prompt provided
         if eval_prompt_file:
             try:
+                # Imported here so importing common.utils does not pay for the openai package
+                from openai import OpenAI
+                
                 # Read the evaluation prompt
                 eval_prompt = read_prompt_file(eval_prompt_file)
                 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Check find_all_matching_files against Path.rglob on a scratch tree, including '**'
+in the middle of a pattern (e.g. 'src/**/*.py') and '.', '..' and empty segments.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from common.tools import find_all_matching_files
+
+FILES = [
+    "top.py",
+    "src/a.py",
+    "src/b.txt",
+    "src/sub/c.py",
+    "src/sub/deep/d.py",
+    "lib/src/e.py",
+    "lib/src/pkg/f.py",
+    "docs/src.py",
+    ".github/workflows/ci.yml",
+]
+
+PATTERNS = [
+    "*",
+    "*.py",
+    "**/*.py",
+    "src/*.py",
+    "src/**/*.py",
+    "src/**/deep/*.py",
+    "**/src/**/*.py",
+    "src/**",
+    "sub/*",
+    "*.yml",
+    ".github/*/*.yml",
+    # Normalised like pathlib: '.' and empty segments drop out, '..' goes to pathlib,
+    # and a bare '**' or trailing '/' selects directories only (so no files)
+    "./*.py",
+    "src/./*.py",
+    "src//*.py",
+    "src/../*.py",
+    "src/**/../*.py",
+    "**",
+    "**/**",
+    "src/",
+]
+
+def main():
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).resolve()
+        for rel in FILES:
+            path = root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x\n")
+
+        for pattern in PATTERNS:
+            expected = sorted(str(p) for p in root.rglob(pattern) if p.is_file())
+            actual = sorted(find_all_matching_files(str(root), pattern, respect_gitignore=False, return_paths_as="str"))
+            if actual == expected:
+                print(f"  ok    {pattern}")
+            else:
+                failures += 1
+                print(f"  FAIL  {pattern}")
+                print(f"    rglob: {[str(Path(p).relative_to(root)) for p in expected]}")
+                print(f"    found: {[str(Path(p).relative_to(root)) for p in actual]}")
+
+    print(f"\n{len(PATTERNS) - failures}/{len(PATTERNS)} patterns match rglob")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
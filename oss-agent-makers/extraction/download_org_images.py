@@ -4,22 +4,39 @@ Download organization images from CSV and save them to chat/assets/ directory
 """
 
 import csv
-import requests
 from urllib.parse import urlparse
 from pathlib import Path
 import time
+from http_session import (
+    create_session,
+    load_validators,
+    save_validators,
+    conditional_headers,
+    remember_validators,
+)
 
-def download_image(url, save_path):
-    """Download an image from URL and save it to the specified path."""
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# One pooled session for all requests so keep-alive connections are reused
+SESSION = create_session(HEADERS)
+
+def save_image(response, save_path):
+    """Stream an image response body into save_path."""
+    with open(save_path, 'wb') as f:
+        for chunk in response.iter_content(65536):
+            f.write(chunk)
+
+def download_image(url, save_path, validators):
+    """Download an image from URL and save it to the specified path, recording its validators."""
     try:
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        
-        # Write the image
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
+        with SESSION.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            
+            # Write the image
+            save_image(response, save_path)
+            remember_validators(validators, save_path, url, response)
         return True
     except Exception as e:
         print(f"  Error downloading: {e}")
@@ -45,6 +62,10 @@ def main():
     # Create assets directory if it doesn't exist
     assets_dir.mkdir(parents=True, exist_ok=True)
     
+    # ETag/Last-Modified of previous downloads, so unchanged images are not fetched again
+    validators_file = assets_dir / '.etags.json'
+    validators = load_validators(validators_file)
+    
     # Read CSV and process each row
     with open(csv_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
@@ -97,17 +118,34 @@ def main():
             downloaded = False
             for url in urls_to_try:
                 try:
-                    # Check if URL exists
-                    response = requests.head(url, timeout=5, allow_redirects=True, headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    })
+                    ext = get_file_extension(url)
+                    save_path = assets_dir / f"{filename_base}.{ext}"
                     
-                    if response.status_code == 200:
-                        ext = get_file_extension(url)
-                        save_path = assets_dir / f"{filename_base}.{ext}"
+                    # Check if URL exists (and whether our saved copy is still current) by asking
+                    # for just the first byte; dead links then cost one round trip and no body
+                    headers = {'Range': 'bytes=0-0', **conditional_headers(validators, save_path, url)}
+                    with SESSION.get(url, stream=True, timeout=5, headers=headers) as response:
+                        if response.status_code == 304:
+                            print(f"  ✓ Unchanged since last run: {save_path}")
+                            downloaded = True
+                            break
+                        
+                        if not response.headers.get('Content-Type', '').startswith('image/'):
+                            continue
                         
+                        if response.status_code == 200:
+                            # Server ignored the Range header and is sending the whole image,
+                            # so keep streaming it rather than requesting it again
+                            print(f"  Found image at: {url}")
+                            save_image(response, save_path)
+                            remember_validators(validators, save_path, url, response)
+                            print(f"  ✓ Saved to: {save_path}")
+                            downloaded = True
+                            break
+                    
+                    if response.status_code == 206:
                         print(f"  Found image at: {url}")
-                        if download_image(url, save_path):
+                        if download_image(url, save_path, validators):
                             print(f"  ✓ Saved to: {save_path}")
                             downloaded = True
                             break
@@ -120,12 +158,13 @@ def main():
             # Small delay to be respectful
             time.sleep(0.5)
     
+    save_validators(validators_file, validators)
     print("\n✅ Download complete!")
     
     # List downloaded files
     print("\nDownloaded files:")
     for file in sorted(assets_dir.glob('*')):
-        if file.is_file() and file.name != '.gitkeep':
+        if file.is_file() and not file.name.startswith('.'):
             print(f"  {file.name}")
 
 if __name__ == "__main__":
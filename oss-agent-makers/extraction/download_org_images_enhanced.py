@@ -5,24 +5,64 @@ This version also tries to extract images from the HTML page itself.
 """
 
 import csv
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urljoin
 from pathlib import Path
 import time
 import re
 from bs4 import BeautifulSoup
+from http_session import (
+    create_session,
+    load_validators,
+    save_validators,
+    conditional_headers,
+    remember_validators,
+)
 
-def download_image(url, save_path):
-    """Download an image from URL and save it to the specified path."""
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# One pooled session for all requests so keep-alive connections are reused
+SESSION = create_session(HEADERS)
+
+# Keywords that mark an <img> as a likely logo (searched in src/alt/class/id)
+LOGO_KEYWORDS = re.compile(r'logo|brand|icon')
+
+# Probe URLs that returned 404 this run, so rows sharing a host skip them
+KNOWN_404 = set()
+
+# Candidate URLs for one row are probed concurrently on this pool (it shares SESSION's connections)
+PROBE_POOL = ThreadPoolExecutor(max_workers=10)
+
+def probe_image(url, headers):
+    """Streamed GET of a candidate URL; returns the open response if it is an image or a 304, else None."""
+    try:
+        response = SESSION.get(url, stream=True, timeout=5, allow_redirects=True, headers=headers)
+    except Exception:
+        return None
+    
+    content_type = response.headers.get('content-type', '')
+    if response.status_code == 304 or (response.status_code == 200 and content_type.startswith('image/')):
+        return response
+    
+    if response.status_code == 404:
+        KNOWN_404.add(url)
+    response.close()
+    return None
+
+def close_probe(future):
+    """Done-callback that closes a probe response nobody is going to read."""
+    if not future.cancelled() and future.result() is not None:
+        future.result().close()
+
+def save_image(response, save_path):
+    """Stream an already-open image response to the specified path."""
     try:
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        
         # Write the image
         with open(save_path, 'wb') as f:
-            f.write(response.content)
+            for chunk in response.iter_content(65536):
+                f.write(chunk)
         return True
     except Exception as e:
         print(f"  Error downloading: {e}")
@@ -40,50 +80,53 @@ def get_file_extension(url):
     # Otherwise default to png
     return 'png'
 
-def extract_images_from_html(url):
-    """Extract potential logo/image URLs from the HTML page."""
+def extract_images_from_html(url, base_url):
+    """Extract potential logo/image URLs from the HTML page, resolved against base_url."""
     images = []
     
     try:
-        response = requests.get(url, timeout=10, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
-        
-        # Look for Open Graph image
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            images.append(urljoin(base_url, og_image['content']))
-        
-        # Look for Twitter image
-        twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-        if twitter_image and twitter_image.get('content'):
-            images.append(urljoin(base_url, twitter_image['content']))
-        
-        # Look for apple touch icon
-        apple_icon = soup.find('link', rel='apple-touch-icon')
-        if apple_icon and apple_icon.get('href'):
-            images.append(urljoin(base_url, apple_icon['href']))
+        soup = BeautifulSoup(response.text, 'lxml')
         
-        # Look for favicon link tags
-        for rel in ['icon', 'shortcut icon']:
-            icon = soup.find('link', rel=rel)
-            if icon and icon.get('href'):
-                images.append(urljoin(base_url, icon['href']))
+        # One pass over the candidate tags; keep the first meta/link of each kind
+        # (as soup.find would) and every <img>, then emit them in priority order
+        first = {}
+        logo_images = []
+        for tag in soup.find_all(['meta', 'link', 'img', 'image']):
+            if tag.name == 'meta':
+                if tag.get('property') == 'og:image':
+                    # Look for Open Graph image
+                    first.setdefault('og:image', tag)
+                elif tag.get('name') == 'twitter:image':
+                    # Look for Twitter image
+                    first.setdefault('twitter:image', tag)
+            elif tag.name == 'link':
+                # Look for apple touch icon and favicon link tags
+                rel = tag.get('rel', [])
+                if 'apple-touch-icon' in rel:
+                    first.setdefault('apple-touch-icon', tag)
+                if 'icon' in rel:
+                    first.setdefault('icon', tag)
+                if ' '.join(rel) == 'shortcut icon':
+                    first.setdefault('shortcut icon', tag)
+            else:
+                # Look for logo in common places
+                src = tag.get('src', '')
+                alt = tag.get('alt', '').lower()
+                class_name = ' '.join(tag.get('class', [])).lower()
+                id_name = tag.get('id', '').lower()
+                
+                if LOGO_KEYWORDS.search(src.lower() + alt + class_name + id_name):
+                    logo_images.append(urljoin(base_url, src))
         
-        # Look for logo in common places
-        for tag in soup.find_all(['img', 'image']):
-            src = tag.get('src', '')
-            alt = tag.get('alt', '').lower()
-            class_name = ' '.join(tag.get('class', [])).lower()
-            id_name = tag.get('id', '').lower()
-            
-            if any(keyword in src.lower() + alt + class_name + id_name 
-                   for keyword in ['logo', 'brand', 'icon']):
-                images.append(urljoin(base_url, src))
+        for kind, attr in [('og:image', 'content'), ('twitter:image', 'content'),
+                           ('apple-touch-icon', 'href'), ('icon', 'href'), ('shortcut icon', 'href')]:
+            tag = first.get(kind)
+            if tag and tag.get(attr):
+                images.append(urljoin(base_url, tag[attr]))
+        images.extend(logo_images)
         
     except Exception as e:
         print(f"  Error parsing HTML: {e}")
@@ -98,6 +141,10 @@ def main():
     # Create assets directory if it doesn't exist
     assets_dir.mkdir(parents=True, exist_ok=True)
     
+    # ETag/Last-Modified of previous downloads, so unchanged images are not fetched again
+    validators_file = assets_dir / '.etags.json'
+    validators = load_validators(validators_file)
+    
     # Read CSV and process each row
     with open(csv_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
@@ -125,13 +172,13 @@ def main():
             # Clean project name for filename
             filename_base = project.replace(' ', '_').replace('/', '_')
             
-            # First, extract images from the HTML page
-            html_images = extract_images_from_html(org_url)
-            
             # Parse the base URL
             parsed = urlparse(org_url)
             base_url = f"{parsed.scheme}://{parsed.netloc}"
             
+            # First, extract images from the HTML page
+            html_images = extract_images_from_html(org_url, base_url)
+            
             # Combine HTML-extracted images with standard locations
             urls_to_try = html_images + [
                 f"{base_url}/favicon.ico",
@@ -147,33 +194,44 @@ def main():
             ]
             
             # Remove duplicates while preserving order
-            seen = set()
-            unique_urls = []
-            for url in urls_to_try:
-                if url not in seen:
-                    seen.add(url)
-                    unique_urls.append(url)
+            unique_urls = list(dict.fromkeys(urls_to_try))
             
-            # Try each URL
-            downloaded = False
+            # Probe all URLs at once. A streamed GET replaces HEAD-then-GET: the winner's body is
+            # saved from the same response, and losers are closed before reading the body.
+            candidates = []
             for url in unique_urls:
-                try:
-                    # Check if URL exists
-                    response = requests.head(url, timeout=5, allow_redirects=True, headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    })
-                    
-                    if response.status_code == 200:
-                        ext = get_file_extension(url)
-                        save_path = assets_dir / f"{filename_base}.{ext}"
-                        
+                if url not in KNOWN_404:
+                    save_path = assets_dir / f"{filename_base}.{get_file_extension(url)}"
+                    candidates.append((url, save_path))
+            futures = [
+                PROBE_POOL.submit(probe_image, url, conditional_headers(validators, save_path, url))
+                for url, save_path in candidates
+            ]
+            
+            # Take the first usable URL in priority order, not the first to respond
+            downloaded = False
+            for i, ((url, save_path), future) in enumerate(zip(candidates, futures)):
+                response = future.result()
+                if response is None:
+                    continue
+                
+                with response:
+                    if response.status_code == 304:
+                        print(f"  ✓ Unchanged since last run: {save_path}")
+                        downloaded = True
+                    else:
                         print(f"  Found image at: {url}")
-                        if download_image(url, save_path):
+                        if save_image(response, save_path):
                             print(f"  ✓ Saved to: {save_path}")
+                            remember_validators(validators, save_path, url, response)
                             downloaded = True
-                            break
-                except:
-                    continue
+                
+                if downloaded:
+                    # Drop the lower-priority probes without waiting for them
+                    for rest in futures[i + 1:]:
+                        if not rest.cancel():
+                            rest.add_done_callback(close_probe)
+                    break
             
             if not downloaded:
                 print(f"  ✗ Could not find downloadable image for {project}")
@@ -181,12 +239,13 @@ def main():
             # Small delay to be respectful
             time.sleep(0.5)
     
+    save_validators(validators_file, validators)
     print("\n✅ Download complete!")
     
     # List downloaded files
     print("\nDownloaded files:")
     for file in sorted(assets_dir.glob('*')):
-        if file.is_file() and file.name != '.gitkeep':
+        if file.is_file() and not file.name.startswith('.'):
             print(f"  {file.name}")
 
 if __name__ == "__main__":
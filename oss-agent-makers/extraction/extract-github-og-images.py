@@ -5,31 +5,42 @@ Overwrites oss-agent-makers-with-images.csv with GitHub's og:image URLs.
 """
 
 import csv
-import time
 import re
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
+from http_session import create_session, fetch_og_image, PER_HOST_LIMIT, HOST_MIN_INTERVAL
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Headers to appear more like a regular browser
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# One pooled session for all requests so keep-alive connections are reused; it also
+# caps requests per host and spaces out GitHub requests, since every row starts there
+SESSION = create_session(HEADERS, per_host_limit=PER_HOST_LIMIT, host_min_interval=HOST_MIN_INTERVAL)
+
+# Rows fetched concurrently (the session's per-host limits keep this polite)
+MAX_WORKERS = 5
+
 def get_github_og_image(github_url):
     """Extract og:image from GitHub repository page."""
     try:
-        # Use curl to get the page content
-        result = subprocess.run(['curl', '-s', github_url], capture_output=True, text=True)
-        html_content = result.stdout
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Find the og:image meta tag
+        # Find the og:image meta tag, stopping the download once it has been seen
         # <meta property="og:image" content="https://opengraph.githubassets.com/...">
-        og_image_tag = soup.find('meta', property='og:image')
+        og_image_url, html_content = fetch_og_image(SESSION, github_url)
+        
+        # Fall back to a full parse if the tag was not in the page head
+        if og_image_url is None:
+            soup = BeautifulSoup(html_content, 'lxml')
+            og_image_tag = soup.find('meta', property='og:image')
+            og_image_url = og_image_tag.get('content') if og_image_tag else None
         
-        if og_image_tag and og_image_tag.get('content'):
-            og_image_url = og_image_tag['content']
+        if og_image_url:
             logger.info(f"Found og:image: {og_image_url}")
             return og_image_url
         else:
@@ -51,31 +62,31 @@ def process_csv():
         reader = csv.DictReader(f)
         rows = list(reader)
     
-    # Process each row
-    for i, row in enumerate(rows):
-        project = row['Project']
-        github_url = row.get('Github URL', '').strip()
-        
-        logger.info(f"\nProcessing {i+1}/{len(rows)}: {project}")
-        
-        # Skip if GitHub URL is malformed
-        if not github_url or not github_url.startswith('https://github.com/'):
-            logger.warning(f"Skipping invalid GitHub URL: {github_url}")
-            row['Image'] = ''
-            continue
-        
-        # Get GitHub og:image
-        og_image_url = get_github_og_image(github_url)
-        
-        # Add image URL to row
-        row['Image'] = og_image_url or ''
-        
-        # Be respectful with rate limiting
-        time.sleep(1)
+    # Fetch rows concurrently; the session's per-host limits replace the per-row sleep
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for row in rows:
+            github_url = row.get('Github URL', '').strip()
+            
+            # Skip if GitHub URL is malformed
+            if not github_url or not github_url.startswith('https://github.com/'):
+                logger.warning(f"Skipping invalid GitHub URL: {github_url}")
+                row['Image'] = ''
+                continue
+            
+            # Get GitHub og:image
+            futures[executor.submit(get_github_og_image, github_url)] = row
         
-        # Save progress every 10 items
-        if (i + 1) % 10 == 0:
-            save_progress(rows, output_file)
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = futures[future]
+            
+            # Add image URL to row
+            row['Image'] = future.result() or ''
+            logger.info(f"Completed {done}/{len(futures)}: {row['Project']}")
+            
+            # Save progress every 10 items
+            if done % 10 == 0:
+                save_progress(rows, output_file)
     
     # Final save
     save_progress(rows, output_file)
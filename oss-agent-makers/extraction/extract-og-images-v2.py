@@ -5,13 +5,15 @@ Updates oss-agent-makers.csv with a new Image column.
 """
 
 import csv
-import time
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse, urljoin
 import requests
 from bs4 import BeautifulSoup
+from http_session import create_session, fetch_og_image, PER_HOST_LIMIT, HOST_MIN_INTERVAL
 import logging
 import json
+from html import unescape
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,15 +28,42 @@ HEADERS = {
     'Connection': 'keep-alive',
 }
 
+# One pooled session for all requests so keep-alive connections are reused; it also
+# caps requests per host and spaces out GitHub requests, since every row starts there
+SESSION = create_session(HEADERS, per_host_limit=PER_HOST_LIMIT, host_min_interval=HOST_MIN_INTERVAL)
+
+# Rows fetched concurrently (the session's per-host limits keep this polite)
+MAX_WORKERS = 5
+
+# Repo "About" website link, matched on the raw page before falling back to a full parse
+# Pattern: <a title="https://www.suna.so" role="link" target="_blank" rel="noopener noreferrer nofollow" class="text-bold" href="https://www.suna.so">
+TEXT_BOLD_LINK = re.compile(r'<a\s[^>]*\bclass="[^"]*\btext-bold\b[^"]*"[^>]*>', re.IGNORECASE)
+
+class GitHubUnavailable(Exception):
+    """GitHub throttled us (429), failed server-side (5xx) or could not be reached; worth retrying later."""
+
+def tag_attr(tag, name):
+    """Return an attribute value from a raw HTML tag string, or ''."""
+    match = re.search(rf'\s{name}\s*=\s*"([^"]*)"', tag, re.IGNORECASE)
+    return unescape(match.group(1)) if match else ''
+
 def get_org_website_from_github(github_url):
     """Extract organization website URL from GitHub repo page."""
     try:
-        # Use curl to get the page content (often more reliable than requests for GitHub)
-        import subprocess
-        result = subprocess.run(['curl', '-s', github_url], capture_output=True, text=True)
-        html_content = result.stdout
+        response = SESSION.get(github_url, timeout=10)
+        response.raise_for_status()
+        html_content = response.text
+        
+        # Fast path: scan the raw page for the website link without building a DOM
+        for tag in TEXT_BOLD_LINK.findall(html_content):
+            if tag_attr(tag, 'role') != 'link' or tag_attr(tag, 'target') != '_blank':
+                continue
+            href = tag_attr(tag, 'href')
+            if href and not href.startswith(('https://github.com', '/')) and ('http' in href):
+                logger.info(f"Found website: {href}")
+                return href
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         # Look for the website link with the specific pattern mentioned
         # Pattern: <a title="https://www.suna.so" role="link" target="_blank" rel="noopener noreferrer nofollow" class="text-bold" href="https://www.suna.so">
@@ -60,6 +89,13 @@ def get_org_website_from_github(github_url):
                 logger.info(f"Found website (alt pattern): {href}")
                 return href
             
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code
+        if status == 429 or status >= 500:
+            raise GitHubUnavailable(f"HTTP {status} from {github_url}") from e
+        logger.error(f"Error fetching GitHub page {github_url}: {e}")
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        raise GitHubUnavailable(f"{github_url}: {e}") from e
     except Exception as e:
         logger.error(f"Error fetching GitHub page {github_url}: {e}")
     
@@ -68,20 +104,19 @@ def get_org_website_from_github(github_url):
 def get_og_image_from_website(website_url):
     """Extract og:image from a website."""
     try:
-        response = requests.get(website_url, headers=HEADERS, timeout=10, allow_redirects=True)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Look for og:image meta tag, stopping the download once it has been seen
+        image_url, html_content = fetch_og_image(SESSION, website_url)
         
-        # Look for og:image meta tag
-        og_image = soup.find('meta', property='og:image')
-        if not og_image:
-            # Try alternative attribute name
-            og_image = soup.find('meta', attrs={'name': 'og:image'})
+        # Fall back to a full parse if the tag was not in the page head
+        if image_url is None:
+            soup = BeautifulSoup(html_content, 'lxml')
+            og_image = soup.find('meta', property='og:image')
+            if not og_image:
+                # Try alternative attribute name
+                og_image = soup.find('meta', attrs={'name': 'og:image'})
+            image_url = og_image.get('content') if og_image else None
         
-        if og_image and og_image.get('content'):
-            image_url = og_image['content']
-            
+        if image_url:
             # Make relative URLs absolute
             image_url = urljoin(website_url, image_url)
                 
@@ -110,19 +145,63 @@ def get_github_avatar(github_url):
     
     return None
 
+def find_image_for_repo(project, github_url):
+    """
+    Find an image for one repo: org website og:image, falling back to the GitHub avatar.
+    Returns (image_url, final); final is False when GitHub could not be read, so the
+    avatar is only a stand-in and the repo should be retried on the next run.
+    """
+    logger.info(f"Processing {project}")
+    
+    # Try to get organization website
+    try:
+        org_website = get_org_website_from_github(github_url)
+    except GitHubUnavailable as e:
+        logger.warning(f"GitHub unavailable for {project} ({e}); using avatar until the next run")
+        return get_github_avatar(github_url) or '', False
+    
+    image_url = None
+    
+    # If we found an org website, try to get og:image
+    if org_website:
+        image_url = get_og_image_from_website(org_website)
+    
+    # Fallback to GitHub avatar
+    if not image_url:
+        logger.info("Falling back to GitHub avatar")
+        image_url = get_github_avatar(github_url)
+    
+    return image_url or '', True
+
 def process_csv():
     """Main function to process the CSV file."""
     input_file = '../data/oss-agent-makers.csv'
     output_file = '../data/oss-agent-makers-with-images.csv'
-    progress_file = '../logs/og-extraction-progress.json'
+    progress_file = '../logs/og-extraction-progress.jsonl'
+    legacy_progress_file = '../logs/og-extraction-progress.json'
     
-    # Load progress if exists
+    # Load progress if exists (one {"project": image_url} object per line, later lines win)
     progress = {}
     try:
         with open(progress_file, 'r') as f:
-            progress = json.load(f)
-    except:
-        pass
+            for line in f:
+                try:
+                    progress.update(json.loads(line))
+                except ValueError:
+                    # Partial last line from an interrupted run
+                    pass
+    except OSError:
+        # No JSONL log yet: carry over the older single-object progress file once
+        try:
+            with open(legacy_progress_file, 'r') as f:
+                progress = json.load(f)
+        except (OSError, ValueError):
+            pass
+        else:
+            with open(progress_file, 'w') as f:
+                for project, image_url in progress.items():
+                    f.write(json.dumps({project: image_url}) + '\n')
+            logger.info(f"Migrated {len(progress)} entries from {legacy_progress_file} to {progress_file}")
     
     # Read existing data
     rows = []
@@ -130,54 +209,47 @@ def process_csv():
         reader = csv.DictReader(f)
         rows = list(reader)
     
-    # Process each row
-    for i, row in enumerate(rows):
-        project = row['Project']
-        github_url = row.get('Github URL', '').strip()
-        
-        logger.info(f"\nProcessing {i+1}/{len(rows)}: {project}")
-        
-        # Skip if already processed
-        if project in progress:
-            row['Image'] = progress[project]
-            logger.info(f"Already processed, using cached result")
-            continue
-        
-        # Skip if GitHub URL is malformed
-        if not github_url or not github_url.startswith('https://github.com/'):
-            logger.warning(f"Skipping invalid GitHub URL: {github_url}")
-            row['Image'] = ''
-            progress[project] = ''
-            continue
-        
-        # Try to get organization website
-        org_website = get_org_website_from_github(github_url)
-        
-        image_url = None
-        
-        # If we found an org website, try to get og:image
-        if org_website:
-            image_url = get_og_image_from_website(org_website)
-        
-        # Fallback to GitHub avatar
-        if not image_url:
-            logger.info("Falling back to GitHub avatar")
-            image_url = get_github_avatar(github_url)
-        
-        # Add image URL to row
-        row['Image'] = image_url or ''
-        progress[project] = row['Image']
-        
-        # Save progress
-        with open(progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
-        
-        # Be respectful with rate limiting
-        time.sleep(2)
+    # Fetch rows concurrently; the session's per-host limits replace the per-row sleep.
+    # Results are handled on this thread, so progress is only ever written from here.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, open(progress_file, 'a') as progress_log:
+        futures = {}
+        for row in rows:
+            project = row['Project']
+            github_url = row.get('Github URL', '').strip()
+            
+            # Skip if already processed
+            if project in progress:
+                row['Image'] = progress[project]
+                logger.info(f"Already processed {project}, using cached result")
+                continue
+            
+            # Skip if GitHub URL is malformed
+            if not github_url or not github_url.startswith('https://github.com/'):
+                logger.warning(f"Skipping invalid GitHub URL: {github_url}")
+                row['Image'] = ''
+                progress[project] = ''
+                progress_log.write(json.dumps({project: ''}) + '\n')
+                continue
+            
+            futures[executor.submit(find_image_for_repo, project, github_url)] = row
         
-        # Save CSV progress every 5 items
-        if (i + 1) % 5 == 0:
-            save_progress(rows, output_file)
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = futures[future]
+            
+            # Add image URL to row
+            row['Image'], final = future.result()
+            logger.info(f"Completed {done}/{len(futures)}: {row['Project']}")
+            
+            # Save progress by appending just this result rather than rewriting the whole file;
+            # stand-in results from a failed GitHub fetch are left out so the next run retries them
+            if final:
+                progress[row['Project']] = row['Image']
+                progress_log.write(json.dumps({row['Project']: row['Image']}) + '\n')
+                progress_log.flush()
+            
+            # Save CSV progress every 5 items
+            if done % 5 == 0:
+                save_progress(rows, output_file)
     
     # Final save
     save_progress(rows, output_file)
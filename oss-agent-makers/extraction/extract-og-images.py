@@ -5,11 +5,11 @@ Updates oss-agent-makers.csv with a new Image column.
 """
 
 import csv
-import time
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-import requests
 from bs4 import BeautifulSoup
+from http_session import create_session, fetch_og_image, PER_HOST_LIMIT, HOST_MIN_INTERVAL
 import logging
 
 # Set up logging
@@ -21,13 +21,20 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
+# One pooled session for all requests so keep-alive connections are reused; it also
+# caps requests per host and spaces out GitHub requests, since every row starts there
+SESSION = create_session(HEADERS, per_host_limit=PER_HOST_LIMIT, host_min_interval=HOST_MIN_INTERVAL)
+
+# Rows fetched concurrently (the session's per-host limits keep this polite)
+MAX_WORKERS = 5
+
 def get_org_website_from_github(github_url):
     """Extract organization website URL from GitHub repo page."""
     try:
-        response = requests.get(github_url, headers=HEADERS, timeout=10)
+        response = SESSION.get(github_url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Look for the website link in the repo header
         # GitHub uses this pattern for external links
@@ -53,16 +60,16 @@ def get_org_website_from_github(github_url):
 def get_og_image_from_website(website_url):
     """Extract og:image from a website."""
     try:
-        response = requests.get(website_url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
+        # Look for og:image meta tag, stopping the download once it has been seen
+        image_url, html_content = fetch_og_image(SESSION, website_url)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Fall back to a full parse if the tag was not in the page head
+        if image_url is None:
+            soup = BeautifulSoup(html_content, 'lxml')
+            og_image = soup.find('meta', property='og:image')
+            image_url = og_image.get('content') if og_image else None
         
-        # Look for og:image meta tag
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            image_url = og_image['content']
-            
+        if image_url:
             # Make relative URLs absolute
             if image_url.startswith('/'):
                 parsed = urlparse(website_url)
@@ -93,6 +100,26 @@ def get_github_avatar(github_url):
     
     return None
 
+def find_image_for_repo(project, github_url):
+    """Find an image for one repo: org website og:image, falling back to the GitHub avatar."""
+    logger.info(f"Processing {project}")
+    
+    # Try to get organization website
+    org_website = get_org_website_from_github(github_url)
+    
+    image_url = None
+    
+    # If we found an org website, try to get og:image
+    if org_website:
+        image_url = get_og_image_from_website(org_website)
+    
+    # Fallback to GitHub avatar
+    if not image_url:
+        logger.info("Falling back to GitHub avatar")
+        image_url = get_github_avatar(github_url)
+    
+    return image_url or ''
+
 def process_csv():
     """Main function to process the CSV file."""
     input_file = '../data/oss-agent-makers.csv'
@@ -104,42 +131,30 @@ def process_csv():
         reader = csv.DictReader(f)
         rows = list(reader)
     
-    # Process each row
-    for i, row in enumerate(rows):
-        project = row['Project']
-        github_url = row['Github URL']
-        
-        logger.info(f"\nProcessing {i+1}/{len(rows)}: {project}")
-        
-        # Skip if GitHub URL is malformed
-        if not github_url.startswith('https://github.com/'):
-            logger.warning(f"Skipping invalid GitHub URL: {github_url}")
-            row['Image'] = ''
-            continue
-        
-        # Try to get organization website
-        org_website = get_org_website_from_github(github_url)
-        
-        image_url = None
-        
-        # If we found an org website, try to get og:image
-        if org_website:
-            image_url = get_og_image_from_website(org_website)
-        
-        # Fallback to GitHub avatar
-        if not image_url:
-            logger.info("Falling back to GitHub avatar")
-            image_url = get_github_avatar(github_url)
-        
-        # Add image URL to row
-        row['Image'] = image_url or ''
-        
-        # Be respectful with rate limiting
-        time.sleep(1)
+    # Fetch rows concurrently; the session's per-host limits replace the per-row sleep
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for row in rows:
+            github_url = row['Github URL']
+            
+            # Skip if GitHub URL is malformed
+            if not github_url.startswith('https://github.com/'):
+                logger.warning(f"Skipping invalid GitHub URL: {github_url}")
+                row['Image'] = ''
+                continue
+            
+            futures[executor.submit(find_image_for_repo, row['Project'], github_url)] = row
         
-        # Save progress every 10 items
-        if (i + 1) % 10 == 0:
-            save_progress(rows, output_file)
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = futures[future]
+            
+            # Add image URL to row
+            row['Image'] = future.result()
+            logger.info(f"Completed {done}/{len(futures)}: {row['Project']}")
+            
+            # Save progress every 10 items
+            if done % 10 == 0:
+                save_progress(rows, output_file)
     
     # Final save
     save_progress(rows, output_file)
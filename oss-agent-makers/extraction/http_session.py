@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Shared pooled HTTP session for the image/og:image scrapers.
+Keeps connections alive so repeat requests to the same host skip the TCP+TLS handshake,
+and caches DNS lookups so repeated hosts (github.com in every row) resolve once per run.
+"""
+
+import json
+import re
+import socket
+import threading
+import time
+from html import unescape
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool sizing (per host and number of hosts kept alive)
+POOL_SIZE = 20
+
+# How long a resolved address is reused, in seconds
+DNS_CACHE_TTL = 300
+
+# Politeness limits for the concurrent scrapers: requests in flight per host, and the
+# minimum gap in seconds between request starts for hosts every row hits
+PER_HOST_LIMIT = 2
+HOST_MIN_INTERVAL = {'github.com': 1.0}
+
+# <meta property="og:image" content="..."> (attributes in either order, name= also accepted)
+OG_IMAGE_TAG = re.compile(rb'<meta\s(?:[^>]*?\s)?(?:property|name)\s*=\s*["\']og:image["\'][^>]*>', re.IGNORECASE)
+CONTENT_ATTR = re.compile(rb'\scontent\s*=\s*(["\'])(.+?)\1', re.IGNORECASE | re.DOTALL)
+
+# og:image lives in <head>; stop scanning for it after this many bytes
+OG_SCAN_LIMIT = 65536
+# Bytes re-scanned from the previous chunk so a tag split across chunks is still matched
+TAG_OVERLAP = 2048
+
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with a TTL cache keyed by the full lookup arguments."""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+def install_dns_cache():
+    """Route socket.getaddrinfo (used by urllib3 when connecting) through the TTL cache."""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+class HostLimitedSession(requests.Session):
+    """
+    requests.Session that allows at most per_host_limit requests to one host at a time
+    (until its response headers arrive) and spaces request starts to a host by
+    host_min_interval[host] seconds, so worker threads cannot hammer a single site.
+    """
+
+    def __init__(self, per_host_limit, host_min_interval=None):
+        super().__init__()
+        self._per_host_limit = per_host_limit
+        self._host_min_interval = host_min_interval or {}
+        self._host_semaphores = {}
+        self._host_next_start = {}
+        self._host_lock = threading.Lock()
+
+    def request(self, method, url, *args, **kwargs):
+        host = urlparse(url).hostname or ''
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._host_semaphores[host] = threading.BoundedSemaphore(self._per_host_limit)
+
+        with semaphore:
+            interval = self._host_min_interval.get(host)
+            if interval:
+                # Reserve the next start slot for this host, then wait for it
+                with self._host_lock:
+                    now = time.monotonic()
+                    start = max(now, self._host_next_start.get(host, now))
+                    self._host_next_start[host] = start + interval
+                if start > now:
+                    time.sleep(start - now)
+            return super().request(method, url, *args, **kwargs)
+
+def create_session(headers=None, per_host_limit=None, host_min_interval=None):
+    """
+    Create a requests.Session with pooled, retrying adapters and the given default headers.
+    With per_host_limit set, the session is a HostLimitedSession using host_min_interval.
+    """
+    install_dns_cache()
+
+    if per_host_limit:
+        session = HostLimitedSession(per_host_limit, host_min_interval)
+    else:
+        session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def fetch_og_image(session, url, timeout=10):
+    """
+    Stream a page and return (og_image, html).
+    Returns as soon as an og:image tag turns up in the first OG_SCAN_LIMIT bytes, with html None.
+    Otherwise the rest of the page is read and (None, html) is returned so the caller can fall
+    back to a full parse.
+    """
+    with session.get(url, stream=True, timeout=timeout, allow_redirects=True) as response:
+        response.raise_for_status()
+
+        buf = bytearray()
+        scan_from = 0
+        for chunk in response.iter_content(4096):
+            buf += chunk
+            if scan_from >= OG_SCAN_LIMIT:
+                continue
+            for tag in OG_IMAGE_TAG.finditer(buf, scan_from):
+                content = CONTENT_ATTR.search(tag.group(0))
+                if content:
+                    return unescape(content.group(2).decode('utf-8', 'replace')), None
+            scan_from = max(scan_from, len(buf) - TAG_OVERLAP)
+
+        return None, bytes(buf).decode(response.encoding or 'utf-8', errors='replace')
+
+def load_validators(path):
+    """Load saved ETag/Last-Modified validators ({filename: {url, etag, last_modified}})."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_validators(path, validators):
+    """Persist ETag/Last-Modified validators for the next run."""
+    with open(path, 'w') as f:
+        json.dump(validators, f, indent=2)
+
+def conditional_headers(validators, save_path, url):
+    """If-None-Match/If-Modified-Since headers for a file previously saved from the same url."""
+    entry = validators.get(save_path.name)
+    if not entry or entry.get('url') != url or not save_path.exists():
+        return {}
+
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def remember_validators(validators, save_path, url, response):
+    """Record the validators from a successful download of url into save_path."""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        validators[save_path.name] = {'url': url, 'etag': etag, 'last_modified': last_modified}
+    else:
+        validators.pop(save_path.name, None)
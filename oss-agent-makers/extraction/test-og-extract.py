@@ -19,7 +19,7 @@ def test_single_project(github_url):
         response = requests.get(github_url, headers=HEADERS, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Look for website link - check different patterns
         website_url = None
@@ -47,7 +47,7 @@ def test_single_project(github_url):
                 web_response = requests.get(website_url, headers=HEADERS, timeout=10)
                 web_response.raise_for_status()
                 
-                web_soup = BeautifulSoup(web_response.text, 'html.parser')
+                web_soup = BeautifulSoup(web_response.text, 'lxml')
                 og_image = web_soup.find('meta', property='og:image')
                 
                 if og_image and 'content' in og_image.attrs: